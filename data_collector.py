@@ -1,24 +1,133 @@
+import array
+import json
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from collections import Counter
+from datetime import datetime
+from sensor import Sensor
+
+
+def _sensor_default(obj):
+    if isinstance(obj, Sensor):
+        return obj.to_dict()
+    raise TypeError(f"Неможливо серіалізувати {type(obj).__name__}")
+
+
 class DataCollector:
     """
     Тут клас для збору та обробки даних з сенсорів
     """
 
     def __init__(self):
-        self.data = []
+        self.ids = []
+        self.types = []
+        self.values = array.array("d")
+        self.units = []
+        self.locations = []
+        self._readings_total = 0
+        self._types_count = Counter()
+        self.sensors = {}
+        self.reports = []
 
     def collect(self, sensor):
+        self.sensors[sensor.sensor_id] = sensor
         try:
             value = sensor.read_data()
-            self.data.append({
-                "sensor_id": sensor.sensor_id,
-                "type": sensor.sensor_type.name,
-                "value": value,
-                "unit": sensor.sensor_type.unit,
-                "location": sensor.location
-            })
+            self.ids.append(sensor.sensor_id)
+            self.types.append(sensor.sensor_type.name)
+            self.values.append(value)
+            self.units.append(sensor.sensor_type.unit)
+            self.locations.append(sensor.location)
+            self._readings_total += 1
+            self._types_count[sensor.sensor_type.name] += 1
         except ValueError as e:
             print(f"[!] Помилка зчитування: {e}")
 
+    def rows(self):
+        """
+        Тут построковий словниковий вигляд зібраних даних для сумісності
+        """
+        for sid, t, v, u, loc in zip(self.ids, self.types, self.values, self.units, self.locations):
+            yield {
+                "sensor_id": sid,
+                "type": t,
+                "value": v,
+                "unit": u,
+                "location": loc
+            }
+
+    def get_statistics(self):
+        """
+        Тут зведена статистика по зібраних даних, ведеться інкрементально
+        """
+        return {
+            "readings_total": self._readings_total,
+            "types_count": self._types_count
+        }
+
+    def generate_report(self, title="Звіт"):
+        """
+        Тут формує легкий звіт: лише метадані та підписи сенсорів,
+        без проміжних копій їхніх зведень
+        """
+        report = {
+            "title": title,
+            "generated_at": datetime.now().isoformat(sep=" ", timespec="seconds"),
+            "sensor_ids": list(self.sensors),
+            "_sigs": {
+                sensor_id: (len(sensor.readings), sensor._sum)
+                for sensor_id, sensor in self.sensors.items()
+            }
+        }
+        self.reports.append(report)
+        return report
+
+    def validate_report(self, report):
+        """
+        Тут перевіряє звіт проти поточного стану сенсорів;
+        порівнюються підписи (кількість показань, сума)
+        """
+        for sensor_id in report["sensor_ids"]:
+            sensor = self.sensors.get(sensor_id)
+            if sensor is None:
+                return False
+            sig = report["_sigs"].get(sensor_id)
+            if sig is None or tuple(sig) != (len(sensor.readings), sensor._sum):
+                return False
+        return True
+
+    def save_report_to_file(self, report, filename="report.json"):
+        """
+        Тут серіалізує звіт напряму з живих об'єктів Sensor через
+        default=, без проміжного списку словників
+        """
+        payload = {
+            "title": report["title"],
+            "generated_at": report["generated_at"],
+            "sensors": [self.sensors[sensor_id] for sensor_id in report["sensor_ids"]]
+        }
+        if orjson is not None:
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(
+                    payload,
+                    default=_sensor_default,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(payload, f, default=_sensor_default, indent=2, ensure_ascii=False)
+
     def report(self):
-        for entry in self.data:
-            print(f"{entry['location']} – {entry['type']}: {entry['value']} {entry['unit']}")
+        if not self.values:
+            return
+        sys.stdout.write(
+            "\n".join(
+                f"{loc} – {t}: {v} {u}"
+                for loc, t, v, u in zip(self.locations, self.types, self.values, self.units)
+            ) + "\n"
+        )
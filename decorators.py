@@ -1,7 +1,11 @@
+import functools
+
+
 def log_action(func):
     """
     Тут декоратор для логування дій
     """
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         print(f"Почекайте, йде виконання {func.__name__}")
         return func(*args, **kwargs)
@@ -1,4 +1,10 @@
 import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from datetime import datetime
 from sensor_type import SensorType
 from sensor import Sensor
@@ -7,22 +13,46 @@ from recommendation import get_recommendation
 from decorators import log_action
 from validator import verify_reports, validate_value
 
+LOG_FILE = "eco_log.ndjson"
+
+def _dumps_line(entry):
+    if orjson is not None:
+        return orjson.dumps(entry)
+    return json.dumps(entry, ensure_ascii=False).encode("utf-8")
+
+def _loads_line(line):
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
 @log_action
 def save_to_json(entry):
     """
-    Зберігає отримані дані у файл JSON.
+    Додає один запис у лог (по одному JSON-рядку на запис).
     """
-    filename = "eco_log.json"
-    try:
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        data = []
+    with open(LOG_FILE, "ab") as f:
+        f.write(_dumps_line(entry))
+        f.write(b"\n")
 
-    data.append(entry)
+@log_action
+def save_batch_to_json(entries):
+    """
+    Додає одразу пачку записів у лог одним відкриттям файлу;
+    повертає зміщення, з якого почався запис.
+    """
+    with open(LOG_FILE, "ab") as f:
+        pos = f.seek(0, 2)
+        f.writelines(_dumps_line(entry) + b"\n" for entry in entries)
+    return pos
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+def load_ndjson(filename=LOG_FILE):
+    """
+    Читає лог построково та повертає розібрані записи.
+    """
+    with open(filename, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield _loads_line(line)
 
 def main():
     print("🌍 Вітаю у системі моніторингу екологічних показників 🌱")
@@ -61,6 +91,10 @@ def main():
         Sensor("S5", custom_sensor_type, custom_location)
     ]
 
+    by_type = {}
+    for sensor in sensors:
+        by_type.setdefault(sensor.sensor_type.name, []).append(sensor)
+
     while True:
         print("\n📌 Який екологічний показник вас цікавить?")
         print("(оберіть: Температура, CO2, PM2.5, Вологість або", custom_sensor_type.name, ")")
@@ -79,32 +113,35 @@ def main():
         selected_type = available_types[choice]
         collector = DataCollector()
 
-        for sensor in sensors:
-            if sensor.sensor_type.name == selected_type.name:
-                collector.collect(sensor)
+        for sensor in by_type.get(selected_type.name, ()):
+            collector.collect(sensor)
 
         valid_data = []
-        for entry in collector.data:
+        now = datetime.now().isoformat(sep=" ", timespec="seconds")
+        for entry in collector.rows():
             try:
                 validated_value = validate_value(entry["value"], entry["type"])
                 recommendation = get_recommendation(entry["type"], validated_value)
-                entry["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                entry["timestamp"] = now
                 entry["recommendation"] = recommendation
-                save_to_json(entry)
                 valid_data.append(entry)
             except ValueError as e:
                 print(f"⚠️ {e}")
 
+        batch_offset = save_batch_to_json(valid_data)
+
         print(f"\n📊 [Звіт по показнику: {selected_type.name}]")
-        for entry in valid_data:
-            print(
-                f"📍 {entry['location']} – {entry['type']}: {entry['value']:.2f} {entry['unit']}\n"
-                f"💡 Рекомендація: {entry['recommendation']}\n"
-            )
+        print("\n".join(
+            f"📍 {entry['location']} – {entry['type']}: {selected_type.format_reading(entry['value'])}\n"
+            f"💡 Рекомендація: {entry['recommendation']}\n"
+            for entry in valid_data
+        ))
 
         try:
-            with open("eco_log.json", "r", encoding="utf-8") as f:
-                saved_data = json.load(f)[-len(valid_data):]
+            with open(LOG_FILE, "rb") as f:
+                f.seek(batch_offset)
+                tail_bytes = f.read()
+            saved_data = [_loads_line(line) for line in tail_bytes.splitlines() if line.strip()]
 
             if verify_reports(valid_data, saved_data):
                 print("✅ Звіт успішно перевірено: всі дані відповідають зібраним.")
@@ -117,7 +154,9 @@ def main():
         if add_more == "так":
             new_sensor_type, new_location, min_val, max_val = add_custom_sensor_type()
             available_types[new_sensor_type.name] = new_sensor_type
-            sensors.append(Sensor(f"S{len(sensors)+1}", new_sensor_type, new_location))
+            new_sensor = Sensor(f"S{len(sensors)+1}", new_sensor_type, new_location)
+            sensors.append(new_sensor)
+            by_type.setdefault(new_sensor_type.name, []).append(new_sensor)
             custom_limits[new_sensor_type.name] = (min_val, max_val)
 
 if __name__ == "__main__":
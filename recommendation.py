@@ -1,41 +1,20 @@
-def get_recommendation(sensor_type: str, value: float) -> str:
-    """
-    Тута повертає рекомендацію на основі значення
-    """
-    if sensor_type == "Температура":
-        if value < 0:
-            return "🥶 Дуже холодно! Залишайтеся в теплі та пийте гарячий чай."
-        elif 0 <= value < 15:
-            return "🧥 Прохолодно. Одягніться тепліше!"
-        elif 15 <= value < 25:
-            return "🌤️ Приємна погода. Можна прогулятись!"
-        elif 25 <= value < 35:
-            return "😎 Тепло. Візьміть сонцезахисні окуляри!"
-        else:
-            return "🔥 Спека! Пийте більше води та уникайте сонця."
+import functools
+
+from sensor_specs import SENSOR_SPECS
 
-    elif sensor_type == "CO2":
-        if value < 1000:
-            return "✅ CO2 в нормі. Повітря чисте."
-        elif 1000 <= value < 2000:
-            return "😐 Трохи перевищено. Провітріть приміщення."
-        else:
-            return "🚨 Високий рівень CO2! Вийдіть на свіже повітря."
+_DEFAULT = "ℹ️ Немає рекомендації для цього показника."
 
-    elif sensor_type == "PM2.5":
-        if value < 15:
-            return "🌱 Повітря чисте. Безпечно для всіх."
-        elif 15 <= value < 35:
-            return "😷 Легке забруднення. Можна гуляти, але не бігайте."
-        else:
-            return "☠️ Забруднення повітря! Краще залишайтеся вдома."
 
-    elif sensor_type == "Вологість":
-        if value < 30:
-            return "💨 Сухо. Використовуйте зволожувач повітря."
-        elif 30 <= value <= 60:
-            return "👌 Комфортна вологість. Ідеально!"
-        else:
-            return "💦 Висока вологість. Можлива задуха. Провітрюйте!"
+@functools.lru_cache(maxsize=2048)
+def _cached_recommendation(sensor_type, rounded_value):
+    spec = SENSOR_SPECS.get(sensor_type)
+    if spec is None:
+        return _DEFAULT
+    return spec.recommend(rounded_value)
 
-    return "ℹ️ Немає рекомендації для цього показника."
+
+def get_recommendation(sensor_type: str, value: float) -> str:
+    """
+    Тута повертає рекомендацію на основі значення
+    """
+    return _cached_recommendation(sensor_type, round(value, 1))
@@ -1,4 +1,10 @@
-from validator import validate_value
+import math
+from collections import namedtuple
+from datetime import datetime
+from validator import validate_value, _LIMITS
+from validator_numba import gen_validate, _uniform
+
+Reading = namedtuple("Reading", ("value", "timestamp", "formatted"))
 
 
 class Sensor:
@@ -10,11 +16,71 @@ class Sensor:
         self.sensor_id = sensor_id
         self.sensor_type = sensor_type
         self.location = location
+        self.readings = []
+        self._sum = 0.0
+        self._count = 0
+        self._dict_cache = None
+
+    def add_reading(self, value):
+        """
+        Тут валідоване значення додається в історію показань сенсора
+        """
+        value = validate_value(value, self.sensor_type.name)
+        self.readings.append(
+            Reading(value, datetime.now().isoformat(sep=" ", timespec="seconds"), None)
+        )
+        self._sum += value
+        self._count += 1
+        self._dict_cache = None
+        return value
+
+    def get_average_reading(self):
+        """
+        Тут середнє значення показань, рахується за O(1) з поточної суми
+        """
+        return self._sum / self._count if self._count else 0.0
+
+    def get_latest_reading(self):
+        """
+        Тут останнє показання сенсора (або None, якщо показань ще немає);
+        відформатований рядок рахується ліниво при першому зверненні
+        """
+        if not self.readings:
+            return None
+        latest = self.readings[-1]
+        if latest.formatted is None:
+            latest = latest._replace(formatted=self.sensor_type.format_reading(latest.value))
+            self.readings[-1] = latest
+        return latest
+
+    def to_dict(self):
+        """
+        Тут словник зі зведенням по сенсору; результат кешується,
+        поки не з'явиться нове показання
+        """
+        if self._dict_cache is None:
+            latest = self.get_latest_reading()
+            self._dict_cache = {
+                "sensor_id": self.sensor_id,
+                "type": self.sensor_type.name,
+                "unit": self.sensor_type.unit,
+                "location": self.location,
+                "readings_count": self._count,
+                "latest_reading": latest._asdict() if latest is not None else None,
+                "average_reading": self.get_average_reading(),
+            }
+        return self._dict_cache
 
     def read_data(self):
         """
         Тут реалізований метод,який має повертати згенероване значення та потім застосовувати його
         """
-        import random
-        value = random.uniform(0, 100)
-        return validate_value(value, self.sensor_type.name)
+        rng = _LIMITS.get(self.sensor_type.name)
+        if rng is None:
+            return self.add_reading(_uniform(0.0, 100.0))
+        value = gen_validate(rng[0], rng[1])
+        if math.isnan(value):
+            raise ValueError(
+                f"Недопустиме значення для {self.sensor_type.name}: поза межами [{rng[0]}, {rng[1]}]"
+            )
+        return self.add_reading(value)
@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass(frozen=True, slots=True)
+class SensorSpec:
+    """
+    Тут усі константи одного типу сенсора: одиниця, межі,
+    форматер та функція рекомендації — один пошук у словнику
+    """
+    unit: str
+    lo: float
+    hi: float
+    fmt: Callable
+    recommend: Callable
+
+
+def _recommend_temperature(value):
+    if value < 0:
+        return "🥶 Дуже холодно! Залишайтеся в теплі та пийте гарячий чай."
+    elif 0 <= value < 15:
+        return "🧥 Прохолодно. Одягніться тепліше!"
+    elif 15 <= value < 25:
+        return "🌤️ Приємна погода. Можна прогулятись!"
+    elif 25 <= value < 35:
+        return "😎 Тепло. Візьміть сонцезахисні окуляри!"
+    else:
+        return "🔥 Спека! Пийте більше води та уникайте сонця."
+
+
+def _recommend_co2(value):
+    if value < 1000:
+        return "✅ CO2 в нормі. Повітря чисте."
+    elif 1000 <= value < 2000:
+        return "😐 Трохи перевищено. Провітріть приміщення."
+    else:
+        return "🚨 Високий рівень CO2! Вийдіть на свіже повітря."
+
+
+def _recommend_pm25(value):
+    if value < 15:
+        return "🌱 Повітря чисте. Безпечно для всіх."
+    elif 15 <= value < 35:
+        return "😷 Легке забруднення. Можна гуляти, але не бігайте."
+    else:
+        return "☠️ Забруднення повітря! Краще залишайтеся вдома."
+
+
+def _recommend_humidity(value):
+    if value < 30:
+        return "💨 Сухо. Використовуйте зволожувач повітря."
+    elif 30 <= value <= 60:
+        return "👌 Комфортна вологість. Ідеально!"
+    else:
+        return "💦 Висока вологість. Можлива задуха. Провітрюйте!"
+
+
+def _make_spec(unit, lo, hi, recommend):
+    return SensorSpec(unit, lo, hi, ("{:.2f} " + unit).format, recommend)
+
+
+SENSOR_SPECS = {
+    "Температура": _make_spec("°C", -50.0, 60.0, _recommend_temperature),
+    "CO2": _make_spec("ppm", 0.0, 5000.0, _recommend_co2),
+    "PM2.5": _make_spec("µg/m³", 0.0, 500.0, _recommend_pm25),
+    "Вологість": _make_spec("%", 0.0, 100.0, _recommend_humidity),
+}
@@ -1,3 +1,6 @@
+from sensor_specs import SENSOR_SPECS
+
+
 class SensorType:
     """
     Тут клас для представлення типу сенсора (наприклад, температура, CO2, шум)
@@ -6,3 +9,11 @@ class SensorType:
     def __init__(self, name: str, unit: str):
         self.name = name
         self.unit = unit
+        spec = SENSOR_SPECS.get(name)
+        self._fmt = spec.fmt if spec is not None else ("{:.2f} " + unit).format
+
+    def format_reading(self, value):
+        """
+        Тут форматує показання разом з одиницею вимірювання
+        """
+        return self._fmt(value)
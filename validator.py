@@ -1,25 +1,38 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from sensor_specs import SENSOR_SPECS
+
+_LIMITS = {name: (spec.lo, spec.hi) for name, spec in SENSOR_SPECS.items()}
+
 def validate_value(value, sensor_type):
     """
     Тут проста валідація значень на основі типу сенсора
     """
-    if sensor_type == "Температура":
-        if -50 <= value <= 60:
-            return value
-    elif sensor_type == "CO2":
-        if 0 <= value <= 5000:
-            return value
-    elif sensor_type == "PM2.5":
-        if 0 <= value <= 500:
-            return value
-    elif sensor_type == "Вологість":
-        if 0 <= value <= 100:
-            return value
+    spec = SENSOR_SPECS.get(sensor_type)
+    if spec is not None and spec.lo <= value <= spec.hi:
+        return value
     raise ValueError(f"Недопустиме значення для {sensor_type}: {value}")
 
 def verify_reports(collector_data, saved_data):
     """
     Тут перевіряється, чи дані в звітах збігаються з зібраними даними.
     """
+    if len(collector_data) != len(saved_data):
+        return False
+
+    if np is not None and collector_data:
+        cv = np.fromiter((c["value"] for c in collector_data), dtype=np.float64, count=len(collector_data))
+        sv = np.fromiter((s["value"] for s in saved_data), dtype=np.float64, count=len(saved_data))
+        if np.abs(cv - sv).max() > 0.01:
+            return False
+        return all(
+            c["type"] == s["type"] and c["location"] == s["location"]
+            for c, s in zip(collector_data, saved_data)
+        )
+
     for collected, saved in zip(collector_data, saved_data):
         if collected['type'] != saved['type']:
             return False
@@ -0,0 +1,35 @@
+import random
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+_rng = random.Random()
+_uniform = _rng.uniform
+
+def seed(value=None):
+    """
+    Тут фіксує генератор випадкових значень (для відтворюваних запусків;
+    не впливає на скомпільований Numba-шлях, який використовує np.random)
+    """
+    _rng.seed(value)
+
+if njit is not None:
+    @njit(cache=True)
+    def gen_validate(lo, hi):
+        """
+        Тут генерація значення та перевірка меж у скомпільованому коді;
+        повертає NaN, якщо значення поза межами
+        """
+        value = np.random.uniform(0.0, 100.0)
+        return value if lo <= value <= hi else np.nan
+else:
+    def gen_validate(lo, hi):
+        """
+        Тут чистий Python-запасний варіант, коли Numba не встановлено
+        """
+        value = _uniform(0.0, 100.0)
+        return value if lo <= value <= hi else float("nan")